@@ -0,0 +1,3 @@
+from main import AppController
+
+AppController().run()
@@ -2,21 +2,80 @@
 
 Environment variables:
 - QS_API_BASE_URL: Override the API base URL (default: http://localhost:8000)
+- QS_TEST_ID: Optional preselected test id; when set, login, init and start
+  are sent as one batch request and the app opens the test directly
 """
 
 from __future__ import annotations
 
 import os
 
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
 
 API_BASE_URL: str = os.getenv("QS_API_BASE_URL", "http://localhost:8000")
 
 
+def _env_int(name: str) -> int | None:
+    # Unset or non-numeric values read as None rather than failing at import
+    try:
+        return int(os.environ[name])
+    except (KeyError, ValueError):
+        return None
+
+
+PRESELECTED_TEST_ID: int | None = _env_int("QS_TEST_ID")
+
+# Where the access token is persisted; resolved once instead of per login.
+TOKEN_PATH: str = os.path.join(os.path.expanduser("~"), ".quantum_scholar_token")
+
+# Shared HTTP session so sequential calls to the API reuse pooled keep-alive
+# connections instead of paying a new TCP/TLS handshake each time. The client
+# issues one request per user action, so HTTP/2 multiplexing would buy little.
+SESSION = requests.Session()
+SESSION.headers.update({"Content-Type": "application/json"})
+# Ask for compressed replies (question_json is large, highly compressible text);
+# urllib3 lists only the codings it can decode here, e.g. br once brotli is installed.
+SESSION.headers.update(make_headers(accept_encoding=True))
+# Retry transient gateway errors so a blip doesn't bounce the user back to the
+# form; the final response is returned (not raised) so callers show its message.
+SESSION.mount(
+    API_BASE_URL,
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=2,
+            # POSTs change server state: never replay one the server may already have
+            # received (a read timeout or a 504), only failed connects and 502/503
+            read=False,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503),
+            allowed_methods=frozenset(["POST"]),
+            raise_on_status=False,
+        ),
+    ),
+)
+
+
 class Endpoints:
     LOGIN = f"{API_BASE_URL}/auth/test-portal/login"
     INIT_TEST = f"{API_BASE_URL}/test-portal/init"
     START_TEST = f"{API_BASE_URL}/test-portal/start"
     UPDATE_ATTEMPT = f"{API_BASE_URL}/test-portal/update-attempt"
+    BATCH = f"{API_BASE_URL}/test-portal/batch"
+
+
+def post_json(url: str, payload, timeout: float | tuple[float, float] = 15) -> requests.Response:
+    """POST ``payload`` serialized with orjson through the shared session.
+
+    The session already sends ``Content-Type: application/json``.
+    """
+    return SESSION.post(url, data=orjson.dumps(payload), timeout=timeout)
 
 
-__all__ = ["API_BASE_URL", "Endpoints"]
+__all__ = ["API_BASE_URL", "PRESELECTED_TEST_ID", "SESSION", "TOKEN_PATH", "Endpoints", "post_json"]
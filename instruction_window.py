@@ -1,81 +1,142 @@
-from PySide6.QtWidgets import QMainWindow, QVBoxLayout, QWidget, QPushButton, QMessageBox
-from PySide6.QtCore import Qt
+import time
+
+from PySide6.QtWidgets import QMainWindow, QVBoxLayout, QWidget, QPushButton, QMessageBox, QTextEdit, QSizePolicy
+from PySide6.QtCore import Qt, Signal
 from config import Endpoints
-import requests
+from network import post_async
 
 class InstructionWindow(QMainWindow):
-    def __init__(self, instructions, attempt_id, on_start_test, email, token, test_id):
+    """Instructions screen; built once and rebound per exam via ``configure``."""
+
+    # Emits (email, token, test_id, attempt_id, question_json, duration_minutes)
+    test_started = Signal(str, str, int, int, object, object)
+
+    def __init__(self):
         super().__init__()
         self.setWindowTitle("Quantum Scholar - AI Proctored Exams (Instructions)")
-        # Set exclusive fullscreen
+        # Exclusive fullscreen, applied when the controller shows the window
         self.setWindowFlags(Qt.Window | Qt.FramelessWindowHint)
-        self.showFullScreen()
 
-        # Store context for starting test
-        self.instructions = instructions
-        self.attempt_id = attempt_id
-        self.on_start_test = on_start_test
-        self.email = email
-        self.token = token
-        self.test_id = test_id
+        # Context for starting the test (set by configure)
+        self.instructions = ""
+        self.attempt_id = None
+        self.email = ""
+        self.token = ""
+        self.test_id = None
 
         # Main widget and layout
         central_widget = QWidget()
         layout = QVBoxLayout()
 
         # Scrollable instructions
-        from PySide6.QtWidgets import QTextEdit, QSizePolicy
         instruction_box = QTextEdit()
         instruction_box.setReadOnly(True)
-        instruction_box.setText(instructions)
         instruction_box.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.instruction_box = instruction_box
         layout.addWidget(instruction_box)
 
         # Start Test button
         start_button = QPushButton("Start Test")
         start_button.setFixedHeight(50)
-        start_button.setStyleSheet("font-size: 18px;")
+        start_button.setObjectName("startTestButton")
         start_button.clicked.connect(self._start_test)
+        self.start_button = start_button
+        self._start_task = None
         layout.addWidget(start_button)
 
         central_widget.setLayout(layout)
         self.setCentralWidget(central_widget)
 
-    def _start_test(self):
-        print(self.test_id)
-        print(self.attempt_id)
+        self._start_requested = False
+        self._prefetched_start = None
+        self._start_key = None
+
+    def configure(self, instructions, attempt_id, email, token, test_id):
+        """Rebind the window to an exam attempt without rebuilding its widgets."""
+        self.instructions = instructions
+        self.attempt_id = attempt_id
+        self.email = email
+        self.token = token
+        self.test_id = test_id
+        self.instruction_box.setText(instructions)
+        self._start_requested = False
+        self._prefetched_start = None
+        self.start_button.setEnabled(True)
+
+        # Fetch the questions while the candidate is still reading; the click
+        # then only has to wait for whatever is left of the round-trip.
+        if self.attempt_id is not None and self._start_task is None:
+            self._request_start()
+
+    def _current_key(self):
+        # Identifies which attempt a START_TEST reply belongs to
+        return (self.test_id, self.attempt_id)
+
+    def _request_start(self):
         payload = {
             "email": self.email,
             "token": self.token,
             "test_id": int(self.test_id),
             "attempt_id": int(self.attempt_id),
         }
+        self._start_key = self._current_key()
+        self._start_task = post_async(Endpoints.START_TEST, payload, 15, self._on_start_finished)
+
+    def _start_test(self):
+        if self._start_requested:
+            return
+        self._start_requested = True
+        self.start_button.setEnabled(False)
+        prefetched, self._prefetched_start = self._prefetched_start, None
+        if prefetched is not None and prefetched[0] == self._current_key():
+            self._handle_start_reply(*prefetched[1:])
+        elif self._start_task is None:
+            self._request_start()
+        # Otherwise the in-flight prefetch finishes the start when it lands
+
+    def _on_start_finished(self, response, data, error):
+        self._start_task = None
+        key = self._start_key
+        if key != self._current_key():
+            # Stale reply for a previous attempt: fetch the current one only once
+            # the candidate has asked to start, so an unclicked start never fires
+            if self._start_requested and self.attempt_id is not None:
+                self._request_start()
+            return
+        if not self._start_requested:
+            # Speculative reply: keep successes for the click, retry failures then
+            if error is None and response.status_code == 200:
+                self._prefetched_start = (key, response, data, error, time.monotonic())
+            return
+        self._handle_start_reply(response, data, error)
+
+    def _handle_start_reply(self, response, data, error, received_at=None):
+        self._start_requested = False
+        self.start_button.setEnabled(True)
+        if error is not None:
+            QMessageBox.critical(self, "Error", str(error))
+            return
         try:
-            response = requests.post(Endpoints.START_TEST, json=payload, timeout=15)
-            data = response.json()
             if response.status_code == 200:
                 # Expecting: {"message": "Test started successfully", "question_json": attempt.QuestionJSON}
                 question_json = data.get("question_json")
                 duration_minutes = data.get("duration_minutes")
+                if received_at is not None and duration_minutes is not None:
+                    # The server clock started when the prefetch was answered
+                    waited = time.monotonic() - received_at
+                    duration_minutes = max(0.0, float(duration_minutes) - waited / 60)
                 if question_json is None:
                     QMessageBox.critical(self, "Start Test Failed", "Missing question_json in response.")
                     return
-                from test_window import TestWindow
-                self.test_window = TestWindow(
-                    email=self.email,
-                    token=self.token,
-                    test_id=int(self.test_id),
-                    attempt_id=int(self.attempt_id),
-                    question_json_string=question_json,
-                    duration_minutes=duration_minutes,
+                # The controller opens the test window and closes this one
+                self.test_started.emit(
+                    self.email,
+                    self.token,
+                    int(self.test_id),
+                    int(self.attempt_id),
+                    question_json,
+                    duration_minutes,
                 )
-                self.test_window.show()
-                # Notify callback (if any)
-                try:
-                    if callable(self.on_start_test):
-                        self.on_start_test()
-                finally:
-                    self.close()
             else:
                 error_msg = data.get("message", response.text)
                 QMessageBox.critical(self, "Start Test Failed", error_msg)
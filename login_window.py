@@ -1,23 +1,23 @@
 
-from PySide6.QtWidgets import QMainWindow, QLabel, QLineEdit, QPushButton, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QMainWindow, QLabel, QLineEdit, QPushButton, QVBoxLayout, QWidget, QDateEdit, QMessageBox
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap
 
-from test_list_window import TestListWindow
-from config import Endpoints
+from config import Endpoints, PRESELECTED_TEST_ID, TOKEN_PATH
+from network import post_async
+from resources import logo_pixmap
+import orjson
 import os
-import sys
-from pathlib import Path
+import requests
 
+# Fail fast when the server is unreachable, but allow a slower reply
+LOGIN_TIMEOUT = (3.05, 10)
 
-def resource_path(*parts: str) -> Path:
-    """Resolve resource paths for dev and PyInstaller-frozen modes."""
-    base = getattr(sys, "_MEIPASS", Path(__file__).resolve().parent)
-    return Path(base, *parts)
 
 class MainWindow(QMainWindow):
     # Emits (tests: list[dict], email: str, token: str)
     login_success = Signal(list, str, str)
+    # Batch fast path; emits (email, token, test_id, attempt_id, question_json, duration_minutes)
+    test_started = Signal(str, str, int, int, object, object)
 
     def __init__(self):
         super().__init__()
@@ -31,34 +31,30 @@ class MainWindow(QMainWindow):
         
         # Logo
         logo_label = QLabel(self)
-        # Robust asset path resolution
-        asset_path = resource_path("assets", "Qubitopia-logo-transparent.png")
-        pixmap = QPixmap(str(asset_path))
-        pixmap = pixmap.scaledToWidth(250, Qt.SmoothTransformation)
-        logo_label.setPixmap(pixmap)
+        # Decoded once per process and shared across window instances
+        logo_label.setPixmap(logo_pixmap(250))
         logo_label.setAlignment(Qt.AlignCenter)
 
-        # Title label with custom font
+        # Title label (styled by APP_QSS)
         label = QLabel("Welcome to Quantum Scholar - AI Proctored Exams!", self)
         label.setAlignment(Qt.AlignCenter)
-        label.setStyleSheet("font-family: 'Segoe UI'; font-size: 28px; font-weight: bold; color: #0d6efd; margin-bottom: 16px;")
+        label.setObjectName("loginTitle")
 
         # Email label and input with custom font
         email_label = QLabel("Email:", self)
         email_label.setAlignment(Qt.AlignCenter)
-        email_label.setStyleSheet("font-family: 'Segoe UI'; font-size: 16px; font-weight: 600; color: #444;")
+        email_label.setObjectName("loginFieldLabel")
         email_input = QLineEdit(self)
         email_input.setPlaceholderText("Enter your email")
         email_input.setAlignment(Qt.AlignCenter)
         email_input.setMinimumWidth(300)
-        email_input.setStyleSheet("font-family: 'Segoe UI'; font-size: 15px; padding: 6px; border-radius: 8px; border: 1px solid #aaa;")
+        email_input.setObjectName("loginInput")
         self.email_input = email_input
 
         # Birthdate label and calendar input with custom font
         birthdate_label = QLabel("Birthdate:", self)
         birthdate_label.setAlignment(Qt.AlignCenter)
-        birthdate_label.setStyleSheet("font-family: 'Segoe UI'; font-size: 16px; font-weight: 600; color: #444;")
-        from PySide6.QtWidgets import QDateEdit
+        birthdate_label.setObjectName("loginFieldLabel")
         birthdate_input = QDateEdit(self)
         birthdate_input.setCalendarPopup(True)
         birthdate_input.setAlignment(Qt.AlignCenter)
@@ -69,8 +65,10 @@ class MainWindow(QMainWindow):
         # Login button with custom style
         login_button = QPushButton("Login", self)
         login_button.setDefault(True)
-        login_button.setStyleSheet("font-family: 'Segoe UI'; font-size: 17px; font-weight: bold; background-color: #2a2a72; color: white; border-radius: 10px; padding: 8px 24px; margin-top: 18px;")
+        login_button.setObjectName("loginButton")
         login_button.clicked.connect(self.login)
+        self.login_button = login_button
+        self._login_task = None
 
         # Add widgets with alignment to prevent horizontal stretching
         layout.addWidget(logo_label, alignment=Qt.AlignHCenter)
@@ -87,8 +85,8 @@ class MainWindow(QMainWindow):
         self.showMaximized()
         
     def login(self):
-        import requests
-        from PySide6.QtWidgets import QMessageBox
+        if self._login_task is not None:
+            return
         email = self.email_input.text()
         birthdate = self.birthdate_input.date().toString("yyyy-MM-dd")
         url = Endpoints.LOGIN
@@ -96,32 +94,118 @@ class MainWindow(QMainWindow):
             "email": email,
             "birthdate": birthdate
         }
+        self._login_email = email
+        self._login_payload = payload
+        self.login_button.setEnabled(False)
+        if PRESELECTED_TEST_ID is not None:
+            # Fast path: login, init and start in one round-trip
+            batch = {
+                "requests": [
+                    {"op": "login", **payload},
+                    {"op": "init", "test_id": PRESELECTED_TEST_ID},
+                    {"op": "start", "test_id": PRESELECTED_TEST_ID},
+                ]
+            }
+            self._login_task = post_async(Endpoints.BATCH, batch, 15, self._on_batch_finished)
+        else:
+            self._login_task = post_async(url, payload, LOGIN_TIMEOUT, self._on_login_finished)
+
+    def _on_batch_finished(self, response, data, error):
+        """Handle the batched login/init/start reply.
+
+        Expected reply: a list with one ``{"status": int, "body": dict}`` entry
+        per op, in request order. Falls back to the plain login endpoint when
+        the batch call is unavailable (e.g. 404) or malformed.
+        """
+        well_formed = (
+            isinstance(data, list)
+            and bool(data)
+            and all(isinstance(e, dict) and isinstance(e.get("body") or {}, dict) for e in data)
+        )
+        if error is not None or response.status_code != 200 or not well_formed:
+            self._login_task = post_async(Endpoints.LOGIN, self._login_payload, LOGIN_TIMEOUT, self._on_login_finished)
+            return
+        self._login_task = None
+        self.login_button.setEnabled(True)
+        login, init, start = (list(data) + [{}, {}])[:3]
+        login_body = login.get("body") or {}
+        if login.get("status") != 200:
+            QMessageBox.critical(self, "Login Failed", login_body.get("message", "Unknown error"))
+            return
+        init_body = init.get("body") or {}
+        start_body = start.get("body") or {}
+        if (
+            init.get("status") != 200
+            or start.get("status") != 200
+            or start_body.get("question_json") is None
+            or init_body.get("attempt_id") is None
+        ):
+            # Login worked but the test could not be started: continue with the normal flow
+            self._complete_login(login_body)
+            return
+        try:
+            token = login_body["token"]
+            self._store_token(token)
+            self.test_started.emit(
+                self._login_email,
+                token,
+                PRESELECTED_TEST_ID,
+                int(init_body.get("attempt_id")),
+                start_body["question_json"],
+                start_body.get("duration_minutes"),
+            )
+        except Exception as e:
+            QMessageBox.critical(self, "Error", str(e))
+
+    def _on_login_finished(self, response, data, error):
+        self._login_task = None
+        self.login_button.setEnabled(True)
+        if isinstance(error, requests.Timeout):
+            QMessageBox.critical(
+                self,
+                "Login Timed Out",
+                "The server did not respond in time. Check your network connection and try again.",
+            )
+            return
+        if error is not None:
+            QMessageBox.critical(self, "Error", str(error))
+            return
         try:
-            response = requests.post(url, json=payload)
-            data = response.json()
             if response.status_code == 200:
-                if "token" in data and "tests" in data:
-                    # Securely store the token
-                    import json as pyjson
-                    token = data["token"]
-                    home = os.path.expanduser("~")
-                    token_path = os.path.join(home, ".quantum_scholar_token")
-                    with open(token_path, "w") as f:
-                        pyjson.dump({"token": token}, f)
-                    # Show test list window with received tests
-                    tests = data["tests"]
-                    # Emit signal for controller or fallback to direct navigation
-                    try:
-                        self.login_success.emit(tests, email, token)
-                    except Exception:
-                        # Fallback: direct navigation
-                        self.test_list_window = TestListWindow(tests, email, token)
-                        self.test_list_window.show()
-                        self.close()
-                else:
-                    QMessageBox.critical(self, "Login Failed", data.get("message", "Unknown error"))
+                self._complete_login(data)
             else:
                 error_msg = data.get("message", response.text)
                 QMessageBox.critical(self, "Login Failed", error_msg)
         except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
\ No newline at end of file
+            QMessageBox.critical(self, "Error", str(e))
+
+    def _complete_login(self, data):
+        """Store the token from a successful login reply and show the test list."""
+        email = self._login_email
+        try:
+            if "token" in data and "tests" in data:
+                token = data["token"]
+                self._store_token(token)
+                # Show test list window with received tests
+                tests = data["tests"]
+                # Navigation is owned by the controller listening on this signal
+                self.login_success.emit(tests, email, token)
+            else:
+                QMessageBox.critical(self, "Login Failed", data.get("message", "Unknown error"))
+        except Exception as e:
+            QMessageBox.critical(self, "Error", str(e))
+
+    @staticmethod
+    def _store_token(token):
+        """Persist the token atomically, skipping the write when it is unchanged."""
+        try:
+            with open(TOKEN_PATH, "rb") as f:
+                if orjson.loads(f.read()).get("token") == token:
+                    return
+        except Exception:
+            pass
+        # Write-then-rename so a crash never leaves a truncated token file
+        tmp_path = TOKEN_PATH + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps({"token": token}))
+        os.replace(tmp_path, TOKEN_PATH)
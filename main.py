@@ -1,40 +1,79 @@
 
 import sys
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtCore import QObject
-from PySide6 import QtGui
 from login_window import MainWindow
-from test_list_window import TestListWindow
-from pathlib import Path
-
-
-def resource_path(*parts: str) -> Path:
-	"""Resolve resource paths for dev and frozen (PyInstaller) modes.
-
-	When frozen, files are next to the executable in dist; _MEIPASS points to
-	the temp unpack dir for onefile, but in onedir we can still rely on cwd/MEIPASS.
-	"""
-	base = getattr(sys, "_MEIPASS", Path(__file__).resolve().parent)
-	return Path(base, *parts)
+from resources import logo_icon
+from styles import APP_QSS
 
 class AppController(QObject):
 	def __init__(self):
 		super().__init__()
 		self.app = QApplication(sys.argv)
-		icon_path = resource_path('assets', 'Qubitopia-logo-transparent.png')
-		self.app.setWindowIcon(QtGui.QIcon(str(icon_path)))
+		self.app.setWindowIcon(logo_icon())
+		# One app-wide stylesheet, parsed once; widgets select rules by objectName
+		self.app.setStyleSheet(APP_QSS)
 		self.login_window = MainWindow()
 		self.login_window.login_success.connect(self.show_test_list_window)
+		self.login_window.test_started.connect(self.show_test_window)
 		self.test_list_window = None
+		# Built on first use and reused (via configure) for later exams
+		self.instruction_window = None
+		self.test_window = None
+		# Session state shared by the windows after login
+		self.email = None
+		self.token = None
 
 	def show_login_window(self):
 		self.login_window.show()
 
 	def show_test_list_window(self, tests, email, token):
+		# Imported on demand: not needed until after a successful login
+		from test_list_window import TestListWindow
+		self.email = email
+		self.token = token
 		self.test_list_window = TestListWindow(tests, email, token)
+		self.test_list_window.exam_initialized.connect(self.show_instruction_window)
 		self.test_list_window.show()
 		self.login_window.close()
 
+	def show_instruction_window(self, instructions, attempt_id, test_id):
+		from instruction_window import InstructionWindow
+		if self.instruction_window is None:
+			self.instruction_window = InstructionWindow()
+			self.instruction_window.test_started.connect(self.show_test_window)
+		self.instruction_window.configure(
+			instructions=instructions,
+			attempt_id=attempt_id,
+			email=self.email,
+			token=self.token,
+			test_id=test_id,
+		)
+		self.instruction_window.showFullScreen()
+		if self.test_list_window is not None:
+			self.test_list_window.close()
+
+	def show_test_window(self, email, token, test_id, attempt_id, question_json, duration_minutes):
+		# Single-use: ending the test quits the application
+		from test_window import TestWindow
+		try:
+			self.test_window = TestWindow(
+				email=email,
+				token=token,
+				test_id=test_id,
+				attempt_id=attempt_id,
+				question_json_string=question_json,
+				duration_minutes=duration_minutes,
+			)
+		except Exception as e:
+			# Raised inside a slot, this would never reach the emitter's own error handling
+			QMessageBox.critical(self.sender(), "Error", str(e))
+			return
+		self.test_window.show()
+		for window in (self.instruction_window, self.login_window):
+			if window is not None:
+				window.close()
+
 	def run(self):
 		self.show_login_window()
 		self.app.exec()
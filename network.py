@@ -0,0 +1,74 @@
+"""Background HTTP helpers that keep blocking network I/O off the GUI thread.
+
+Requests run on ``QThreadPool.globalInstance()`` using the shared session from
+``config``, with bodies encoded and decoded by orjson; results are delivered
+back through a Qt signal so the connected slot (a method of a window) runs on
+the GUI thread and may touch widgets.
+
+QNetworkAccessManager would avoid the worker hop, but it has no equivalent of
+the session's retry adapter, so requests stays the single HTTP client. The
+same holds for an asyncio loop (qasync) with httpx: the app issues at most one
+save at a time, so HTTP/2 multiplexing has nothing to share, and the pooled
+keep-alive session already reuses the connection between calls.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Tuple, Union
+
+import orjson
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from config import post_json
+
+
+# Seconds, or a (connect, read) pair as accepted by requests
+Timeout = Union[float, Tuple[float, float]]
+
+
+class _PostSignals(QObject):
+    # Emits (response, data, error). data is None when error is set; response
+    # is also None unless the request completed and only decoding failed.
+    finished = Signal(object, object, object)
+
+
+class PostTask(QRunnable):
+    """POST a JSON payload on a worker thread and report through ``signals``."""
+
+    def __init__(self, url: str, payload: Dict[str, Any], timeout: Timeout) -> None:
+        super().__init__()
+        self.url = url
+        self.payload = payload
+        self.timeout = timeout
+        self.signals = _PostSignals()
+
+    def run(self) -> None:
+        response = None
+        try:
+            response = post_json(self.url, self.payload, timeout=self.timeout)
+            data = orjson.loads(response.content)
+        except Exception as e:
+            self.signals.finished.emit(response, None, e)
+            return
+        self.signals.finished.emit(response, data, None)
+
+
+def post_async(
+    url: str,
+    payload: Dict[str, Any],
+    timeout: Timeout,
+    on_finished: Callable[[Any, Any, Any], None],
+) -> PostTask:
+    """Start a background POST; ``on_finished(response, data, error)`` runs on the GUI thread.
+
+    ``on_finished`` should be a bound method of a QObject so the queued
+    connection delivers it on that object's (GUI) thread. Callers keep the
+    returned task referenced until it finishes.
+    """
+    task = PostTask(url, payload, timeout)
+    task.signals.finished.connect(on_finished)
+    QThreadPool.globalInstance().start(task)
+    return task
+
+
+__all__ = ["PostTask", "post_async"]
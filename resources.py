@@ -0,0 +1,46 @@
+"""Bundled asset helpers shared by the windows.
+
+Decoded images are cached per process so repeated window construction reuses
+the same pixel buffer instead of decoding the PNG again.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QIcon, QPixmap
+
+
+# Resolved once at import; Path.resolve() stats every path component.
+# When frozen (PyInstaller), _MEIPASS is the bundle's unpack directory.
+BASE_DIR = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent))
+ASSETS_DIR = BASE_DIR / "assets"
+
+LOGO_FILE = "Qubitopia-logo-transparent.png"
+
+_logo_pixmaps: Dict[int, QPixmap] = {}
+_logo_icon: Optional[QIcon] = None
+
+
+def logo_pixmap(width: int = 250) -> QPixmap:
+    """Return the logo scaled to ``width``, decoding it only once per size."""
+    pixmap = _logo_pixmaps.get(width)
+    if pixmap is None:
+        pixmap = QPixmap(str(ASSETS_DIR / LOGO_FILE))
+        pixmap = pixmap.scaledToWidth(width, Qt.SmoothTransformation)
+        _logo_pixmaps[width] = pixmap
+    return pixmap
+
+
+def logo_icon() -> QIcon:
+    """Return the application icon, loading it on first use."""
+    global _logo_icon
+    if _logo_icon is None:
+        _logo_icon = QIcon(str(ASSETS_DIR / LOGO_FILE))
+    return _logo_icon
+
+
+__all__ = ["ASSETS_DIR", "BASE_DIR", "LOGO_FILE", "logo_icon", "logo_pixmap"]
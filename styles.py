@@ -0,0 +1,78 @@
+"""Application-wide Qt stylesheet.
+
+Installed once on the QApplication by ``AppController`` so Qt parses it a
+single time per process; widgets opt in through ``setObjectName`` and the
+matching ``#name`` selectors below.
+"""
+
+from __future__ import annotations
+
+
+APP_QSS: str = """
+/* Login window */
+QLabel#loginTitle {
+    font-family: 'Segoe UI'; font-size: 28px; font-weight: bold;
+    color: #0d6efd; margin-bottom: 16px;
+}
+QLabel#loginFieldLabel {
+    font-family: 'Segoe UI'; font-size: 16px; font-weight: 600; color: #444;
+}
+QLineEdit#loginInput {
+    font-family: 'Segoe UI'; font-size: 15px; padding: 6px;
+    border-radius: 8px; border: 1px solid #aaa;
+}
+QPushButton#loginButton {
+    font-family: 'Segoe UI'; font-size: 17px; font-weight: bold;
+    background-color: #2a2a72; color: white; border-radius: 10px;
+    padding: 8px 24px; margin-top: 18px;
+}
+
+/* Test list window */
+QListView#testList {
+    font-size: 16px; padding: 8px; border-radius: 8px;
+}
+QPushButton#takeExamButton {
+    font-size: 18px; padding: 10px 24px; background: #4f8cff;
+    color: white; border-radius: 8px;
+}
+
+/* Instruction window */
+QPushButton#startTestButton {
+    font-size: 18px;
+}
+
+/* Test window */
+QLabel#testTitle {
+    font-size: 22px; font-weight: bold; padding: 10px;
+}
+QLabel#countdownTimer {
+    font-size: 18px; font-weight: bold; padding: 10px; color: #2e7d32;
+}
+QLabel#countdownTimer[urgency="warning"] { color: #f57c00; }
+QLabel#countdownTimer[urgency="critical"] { color: #d32f2f; }
+QLabel#violationBanner {
+    background-color: #d32f2f; color: white; font-size: 14px;
+    padding: 6px 10px; border-radius: 4px;
+}
+QPushButton#endTestButton {
+    background-color: #d32f2f; color: white; padding: 6px 12px;
+    font-weight: bold; border: none; border-radius: 4px;
+}
+QPushButton#endTestButton:hover { background-color: #b71c1c; }
+QListView#questionBar::item {
+    padding: 6px 14px;
+}
+QListView#questionBar::item:selected {
+    background-color: #0d6efd; color: white;
+}
+QLabel#questionText {
+    font-size: 24px; padding: 8px;
+}
+QWidget#questionOptions QRadioButton,
+QWidget#questionOptions QCheckBox {
+    font-size: 18px; padding: 4px;
+}
+"""
+
+
+__all__ = ["APP_QSS"]
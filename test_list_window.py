@@ -1,12 +1,40 @@
-from PySide6.QtWidgets import QMainWindow, QListWidget, QVBoxLayout, QWidget, QPushButton, QMessageBox
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QMainWindow, QListView, QAbstractItemView, QVBoxLayout, QWidget, QPushButton, QMessageBox
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, Signal
 from config import Endpoints
-import requests
+from network import post_async
+
+class TestsModel(QAbstractListModel):
+    """List model over the raw ``tests`` dicts; row labels are formatted on demand."""
+
+    def __init__(self, tests, parent=None):
+        super().__init__(parent)
+        self._tests = tests
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tests)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        t = self._tests[index.row()]
+        return (
+            f"{t.get('test_id', 'N/A')} | {t.get('test_name', 'Unknown Test')}"
+            f" | Start: {t.get('test_start_time', '')} | End: {t.get('test_end_time', '')}"
+        )
+
+    def test_at(self, row):
+        return self._tests[row]
+
 
 class TestListWindow(QMainWindow):
+    # Emits (instructions: str, attempt_id, test_id: int) once INIT_TEST succeeds
+    exam_initialized = Signal(str, object, int)
+
     def __init__(self, tests, email, token):
         super().__init__()
         self.setWindowTitle("Quantum Scholar - AI Proctored Exams (Tests Available)")
+        self._email = email
+        self._token = token
 
         # Central widget and layout
         central_widget = QWidget()
@@ -16,24 +44,22 @@ class TestListWindow(QMainWindow):
         center_widget = QWidget()
         center_layout = QVBoxLayout()
 
-        # List widget for received tests
-        self.test_list = QListWidget()
-        self.test_list.setSelectionMode(QListWidget.SingleSelection)
+        # List view over the received tests
+        self.tests = list(tests)
+        self.model = TestsModel(self.tests, self)
+        self.test_list = QListView()
+        self.test_list.setModel(self.model)
+        self.test_list.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.test_list.setUniformItemSizes(True)
         self.test_list.setMinimumWidth(600)
-        self.test_list.setStyleSheet("font-size: 16px; padding: 8px; border-radius: 8px;")
-        for test in tests:
-            test_id = test.get("test_id", "N/A")
-            test_name = test.get("test_name", "Unknown Test")
-            start = test.get("test_start_time", "")
-            end = test.get("test_end_time", "")
-            display_text = f"{test_id} | {test_name} | Start: {start} | End: {end}"
-            self.test_list.addItem(display_text)
+        self.test_list.setObjectName("testList")
         center_layout.addWidget(self.test_list, alignment=Qt.AlignHCenter)
 
         # Take Exam button
         self.take_exam_btn = QPushButton("Take Exam")
-        self.take_exam_btn.setStyleSheet("font-size: 18px; padding: 10px 24px; background: #4f8cff; color: white; border-radius: 8px;")
-        self.take_exam_btn.clicked.connect(lambda: self.take_exam(email, token))
+        self.take_exam_btn.setObjectName("takeExamButton")
+        self.take_exam_btn.clicked.connect(self.take_exam)
+        self._init_task = None
         center_layout.addWidget(self.take_exam_btn, alignment=Qt.AlignHCenter)
 
         center_widget.setLayout(center_layout)
@@ -45,44 +71,41 @@ class TestListWindow(QMainWindow):
         # Open window maximized (not exclusive fullscreen)
         self.showMaximized()
 
-    def take_exam(self, email, token):
-        selected_items = self.test_list.selectedItems()
-        if not selected_items:
+    def take_exam(self):
+        if self._init_task is not None:
+            return
+        selected = self.test_list.selectionModel().selectedIndexes()
+        if not selected:
             QMessageBox.warning(self, "No Test Selected", "Please select a test to take.")
             return
-        selected_test = selected_items[0].text()
-        # Extract test_id from display_text
-        test_id = selected_test.split('|')[0].strip() 
+        test_id = self.model.test_at(selected[0].row()).get("test_id", "N/A")
         url = Endpoints.INIT_TEST
         payload = {
-            "email": email,
-            "token": token,
+            "email": self._email,
+            "token": self._token,
             "test_id": int(test_id)
         }
+        self._init_test_id = int(test_id)
+        self.take_exam_btn.setEnabled(False)
+        self._init_task = post_async(url, payload, 10, self._on_init_finished)
+
+    def _on_init_finished(self, response, data, error):
+        self._init_task = None
+        self.take_exam_btn.setEnabled(True)
+        if error is not None:
+            QMessageBox.critical(self, "Error", str(error))
+            return
+        test_id = self._init_test_id
         try:
-            response = requests.post(url, json=payload, timeout=10)
-            data = response.json()
             if response.status_code == 200:
                 # If message key exists and indicates success, proceed
                 msg = data.get("message", "")
                 instructions = data.get("instructions", msg)
                 attempt_id = data.get("attempt_id")
-                from instruction_window import InstructionWindow
-                def on_start_test_success():
-                    # Placeholder, actual navigation handled within InstructionWindow upon successful start
-                    pass
-                self.instruction_window = InstructionWindow(
-                    instructions=instructions,
-                    attempt_id=attempt_id,
-                    on_start_test=on_start_test_success,
-                    email=email,
-                    token=token,
-                    test_id=int(test_id)
-                )
-                self.instruction_window.show()
-                self.close()
+                # The controller shows the instruction window and closes this one
+                self.exam_initialized.emit(instructions, attempt_id, test_id)
             else:
                 error_msg = data.get("message", response.text)
                 QMessageBox.critical(self, "Exam Start Failed", error_msg)
         except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
\ No newline at end of file
+            QMessageBox.critical(self, "Error", str(e))
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, List, Optional, Set, Tuple
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import time
 
-from PySide6.QtCore import Qt, QTimer, QCoreApplication
+import orjson
+from PySide6.QtCore import Qt, QEvent, QObject, QTimer, QAbstractListModel, QModelIndex, QSignalBlocker
 from PySide6.QtGui import QGuiApplication, QKeyEvent
 from PySide6.QtWidgets import (
     QButtonGroup,
@@ -13,18 +14,40 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QMainWindow,
     QMessageBox,
     QPushButton,
     QRadioButton,
-    QScrollArea,
     QVBoxLayout,
     QWidget,
 )
 
-import requests
-
 from config import Endpoints
+from network import post_async
+
+
+class QuestionNumberModel(QAbstractListModel):
+    """1-based question numbers for the selected section; rows are labelled on demand."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._count = 0
+
+    def set_count(self, count: int) -> None:
+        self.beginResetModel()
+        self._count = count
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._count
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return str(index.row() + 1)
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
 
 
 class TestWindow(QMainWindow):
@@ -42,7 +65,29 @@ class TestWindow(QMainWindow):
     }
     """
 
-    def __init__(self, email: str, token: str, test_id: Any, attempt_id: Any, question_json_string: str, duration_minutes: int) -> None:
+    # Common OS/system switching or exit shortcuts, classified with one dict lookup per key press.
+    # Keys that are violations on their own (Windows/Meta, a bare Alt press):
+    _FORBIDDEN_SOLO_KEYS: Dict[int, str] = {
+        Qt.Key_Meta: "Windows key detected",
+        Qt.Key_Super_L: "Windows key detected",
+        Qt.Key_Super_R: "Windows key detected",
+        Qt.Key_Alt: "Alt key detected",
+    }
+    # Keys that are violations with at least the given modifiers, most specific first.
+    # Alt+Tab is often not delivered to the app, but is handled when it is.
+    _FORBIDDEN_COMBOS: Dict[int, Tuple[Tuple[Qt.KeyboardModifier, str], ...]] = {
+        Qt.Key_Tab: ((Qt.AltModifier, "Alt+Tab detected"),),
+        Qt.Key_F4: ((Qt.AltModifier, "Alt+F4 detected"),),
+        Qt.Key_Escape: (
+            (Qt.ControlModifier | Qt.ShiftModifier, "Ctrl+Shift+Esc detected"),  # Task Manager
+            (Qt.ControlModifier, "Ctrl+Esc detected"),  # Start menu
+        ),
+    }
+
+    # Primary screen height, queried once per process (see _screen_height)
+    _cached_screen_height: Optional[int] = None
+
+    def __init__(self, email: str, token: str, test_id: Any, attempt_id: Any, question_json_string: Union[str, bytes], duration_minutes: float) -> None:
         super().__init__()
 
         # Window chrome
@@ -56,39 +101,70 @@ class TestWindow(QMainWindow):
         self.token = token
         self.test_id = test_id
         self.attempt_id = attempt_id
+        # Identity fields sent with every save, built once
+        self._payload_prefix: Dict[str, Any] = {"email": email, "token": token, "attempt_id": attempt_id}
         # Countdown duration
-        self.remaining_seconds: int = max(0, int(duration_minutes)) * 60
+        # Fractional minutes: a prefetched start arrives with its waiting time already deducted
+        self.remaining_seconds: int = max(0, int(float(duration_minutes) * 60))
+        # Countdown format is fixed for the whole test: HH:MM:SS for an hour or more, else MM:SS
+        self._format_seconds = self._format_hms if self.remaining_seconds >= 3600 else self._format_ms
+        # Monotonic end time, set when the countdown starts; ticks derive remaining_seconds from it
+        self._deadline: float = 0.0
 
-        # Parse incoming JSON safely
-        try:
-            question_json: Dict[str, Any] = json.loads(question_json_string)
-        except Exception:
-            question_json = {"title": "Test", "sections": []}
+        # Parsed into a local; the raw string is not kept alongside the parsed tree
+        question_json = self._parse_question_json(question_json_string)
 
         # Model
         self.sections: List[Dict[str, Any]] = question_json.get("sections", [])
         self.test_title: str = question_json.get("title", "Test")
         self.section_titles: List[str] = [s.get("title", "Section") for s in self.sections]
+        # Question lists per section, resolved once so navigation indexes them directly
+        self._questions_by_section: List[List[Dict[str, Any]]] = [s.get("questions") or [] for s in self.sections]
         self.selected_section: int = 0
         self.selected_question: int = 0
 
-        # Answer state storage
-        # answers[(section_idx, question_idx)] =
-        #   - int for mcq (1-based option index)
-        #   - set[int] for msq (1-based option indices)
-        #   - str for open-ended
-        self.answers: Dict[int, Dict[int, Any]] = {}
+        # Answer state storage: one homogeneous dict per question type,
+        # keyed by (section_idx, question_idx); options are 1-based
+        self._mcq_answers: Dict[Tuple[int, int], int] = {}
+        self._msq_answers: Dict[Tuple[int, int], List[int]] = {}  # kept sorted
+        self._open_answers: Dict[Tuple[int, int], str] = {}
+        # Wire-format answer entries, section_idx -> question_idx -> entry, kept in step
+        # with the stores above so a save only groups them. Entries are replaced, never
+        # mutated, as the payload is encoded on a worker thread.
+        self._answer_entries: Dict[int, Dict[int, Dict[str, Any]]] = {}
 
         # UI references we reuse
         self.section_buttons: List[QPushButton] = []
-        self.question_buttons: List[QPushButton] = []
         self.section_bar_layout: QHBoxLayout | None = None
-        self.question_bar_layout: QHBoxLayout | None = None
+        self.question_bar = None  # type: Optional[QListView]
         self.question_layout: QVBoxLayout | None = None
+        self._options_layout: QVBoxLayout | None = None
         self.timer_label = None  # type: Optional[QLabel]
         self.warning_label = None  # type: Optional[QLabel]
         self._countdown_timer = None  # type: Optional[QTimer]
+        # Last values pushed to timer_label, so unchanged ticks touch nothing
+        self._timer_text: Optional[str] = None
+        self._timer_urgency: Optional[str] = None
         self._ending = False
+        self._final_save_sent = False
+        self._final_payload = None  # type: Optional[Dict[str, Any]]  # answers as they stood at end_test
+        self._save_task = None
+        self._save_button = None  # type: Optional[QPushButton]
+        # Open-ended text is stored after typing pauses, not on every keystroke
+        self._open_edit = None  # type: Optional[QLineEdit]
+        self._open_key = None  # type: Optional[Tuple[int, int]]  # question shown in _open_edit
+        self._open_timer = QTimer(self)
+        self._open_timer.setSingleShot(True)
+        self._open_timer.setInterval(200)
+        self._open_timer.timeout.connect(self._store_open_answer)
+        # Autosave: answers changed since the last save are posted quietly every few seconds
+        self._dirty = False
+        self._has_saved = False  # a save has succeeded; with _dirty clear, the server is current
+        self._save_notify = True
+        self._save_requested = False  # Save clicked while a quiet autosave was in flight
+        self._autosave_timer = QTimer(self)
+        self._autosave_timer.setInterval(5000)
+        self._autosave_timer.timeout.connect(self._maybe_autosave)
 
         # Kiosk/violation state
         self.violation_count: int = 0
@@ -101,15 +177,27 @@ class TestWindow(QMainWindow):
         self._populate_question_bar()
         self._update_question_display()
         self._init_countdown_timer()
-
-        # Grab keyboard to ensure we receive as many key events as possible
-        self.grabKeyboard()
+        self._autosave_timer.start()
 
         # Detect app focus changes (e.g., Alt+Tab / Win key). We can't block them at OS level
         # without elevated hooks, but we can detect and respond.
         app = QGuiApplication.instance()
         if app is not None:
             app.applicationStateChanged.connect(self._on_app_state_changed)
+            # Forbidden keys are screened by an application event filter; everything else
+            # reaches the focused widget through Qt's normal dispatch
+            app.installEventFilter(self)
+
+    @staticmethod
+    def _parse_question_json(raw: Union[str, bytes]) -> Dict[str, Any]:
+        """Parse the question JSON (str or bytes), with a safe default on bad input."""
+        try:
+            parsed = orjson.loads(raw)
+        except Exception:
+            parsed = None
+        if not isinstance(parsed, dict):
+            parsed = {"title": "Test", "sections": []}
+        return parsed
 
     # ------------------------- UI BUILDERS -------------------------
     def _build_ui(self) -> None:
@@ -117,9 +205,7 @@ class TestWindow(QMainWindow):
         main_layout = QVBoxLayout()
 
         # Top area is ~20% of screen height
-        screen = QGuiApplication.primaryScreen()
-        screen_height = screen.geometry().height() if screen else 800
-        top_bar_height = int(screen_height * 0.20)
+        top_bar_height = int(self._screen_height() * 0.20)
 
         top_container = QWidget()
         top_container.setFixedHeight(top_bar_height)
@@ -133,30 +219,23 @@ class TestWindow(QMainWindow):
         header_layout.setContentsMargins(0, 0, 0, 0)
 
         title_label = QLabel(self.test_title)
-        title_label.setStyleSheet("font-size: 22px; font-weight: bold; padding: 10px;")
+        title_label.setObjectName("testTitle")
 
         self.timer_label = QLabel(self._format_seconds(self.remaining_seconds))
         self.timer_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self.timer_label.setStyleSheet("font-size: 18px; font-weight: bold; padding: 10px;")
+        self.timer_label.setObjectName("countdownTimer")
 
         # Warning banner (hidden by default)
         self.warning_label = QLabel("")
         self.warning_label.setVisible(False)
-        self.warning_label.setStyleSheet(
-            "background-color: #d32f2f; color: white; font-size: 14px;"
-            " padding: 6px 10px; border-radius: 4px;"
-        )
+        self.warning_label.setObjectName("violationBanner")
+        self._warning_hide_timer = QTimer(self)
+        self._warning_hide_timer.setSingleShot(True)
+        self._warning_hide_timer.setInterval(3000)
+        self._warning_hide_timer.timeout.connect(self.warning_label.hide)
 
         end_button = QPushButton("End Test")
-        end_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #d32f2f; color: white; padding: 6px 12px;
-                font-weight: bold; border: none; border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #b71c1c; }
-            """
-        )
+        end_button.setObjectName("endTestButton")
         end_button.clicked.connect(self.end_test)
 
         header_layout.addWidget(title_label)
@@ -176,103 +255,135 @@ class TestWindow(QMainWindow):
         section_bar_widget.setLayout(self.section_bar_layout)
         top_layout.addWidget(section_bar_widget)
 
-        # Question numbers bar (scrollable)
-        question_bar_widget = QWidget()
-        self.question_bar_layout = QHBoxLayout()
-        question_bar_widget.setLayout(self.question_bar_layout)
-
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setWidget(question_bar_widget)
-        scroll.setFixedHeight(60)
-        top_layout.addWidget(scroll)
+        # Question numbers bar: a horizontal list view, so only visible numbers are painted
+        self.question_model = QuestionNumberModel(self)
+        self.question_bar = QListView()
+        self.question_bar.setObjectName("questionBar")
+        self.question_bar.setModel(self.question_model)
+        self.question_bar.setFlow(QListView.LeftToRight)
+        self.question_bar.setWrapping(False)
+        self.question_bar.setUniformItemSizes(True)
+        self.question_bar.setSelectionMode(QListView.SingleSelection)
+        self.question_bar.setFixedHeight(60)
+        self.question_bar.selectionModel().currentChanged.connect(self._on_question_bar_changed)
+        top_layout.addWidget(self.question_bar)
 
         top_container.setLayout(top_layout)
         main_layout.addWidget(top_container)
 
         # Question display area
+        # Built once: question text, an options container refilled per question,
+        # and the Save/Next row whose signals are connected a single time.
         self.question_area = QWidget()
         self.question_layout = QVBoxLayout()
         self.question_area.setLayout(self.question_layout)
         main_layout.addWidget(self.question_area)
 
+        self._q_label = QLabel("")
+        self._q_label.setObjectName("questionText")
+        self._q_label.setAlignment(Qt.AlignTop)
+        self.question_layout.addWidget(self._q_label)
+
+        self._options_container = QWidget()
+        self._options_container.setObjectName("questionOptions")
+        self._options_layout = QVBoxLayout()
+        self._options_layout.setContentsMargins(0, 0, 0, 0)
+        self._options_container.setLayout(self._options_layout)
+        self.question_layout.addWidget(self._options_container)
+        # Option groups are connected once; button ids are the 1-based option numbers
+        self._mcq_group = QButtonGroup(self)
+        self._mcq_group.idToggled.connect(self._on_mcq_id_toggled)
+        self._msq_group = QButtonGroup(self)
+        self._msq_group.setExclusive(False)
+        self._msq_group.idToggled.connect(self._on_msq_id_toggled)
+        # Option widgets are pooled and relabelled per question rather than recreated;
+        # the choice pools grow to the largest option count seen
+        self._radio_pool: List[QRadioButton] = []
+        self._checkbox_pool: List[QCheckBox] = []
+        self._open_edit = QLineEdit()
+        self._open_edit.setPlaceholderText("Type your answer here...")
+        self._open_edit.textChanged.connect(self._on_open_text_changed)
+        self._open_edit.hide()
+        self._options_layout.addWidget(self._open_edit)
+        self._unknown_label = QLabel("Unknown question type.")
+        self._unknown_label.hide()
+        self._options_layout.addWidget(self._unknown_label)
+
+        self._buttons_row = QWidget()
+        row_layout = QHBoxLayout()
+        row_layout.setAlignment(Qt.AlignCenter)
+        save_button = QPushButton("Save")
+        next_button = QPushButton("Next")
+        save_button.clicked.connect(self.save_answer)
+        next_button.clicked.connect(self.go_to_next_question)
+        self._save_button = save_button
+        row_layout.addWidget(save_button)
+        row_layout.addWidget(next_button)
+        self._buttons_row.setLayout(row_layout)
+        self.question_layout.addWidget(self._buttons_row)
+
         central.setLayout(main_layout)
         self.setCentralWidget(central)
 
+    @classmethod
+    def _screen_height(cls) -> int:
+        if cls._cached_screen_height is None:
+            screen = QGuiApplication.primaryScreen()
+            cls._cached_screen_height = screen.geometry().height() if screen else 800
+        return cls._cached_screen_height
+
     # ------------------------- KIOSK ENFORCEMENT -------------------------
     def _on_app_state_changed(self, state: Qt.ApplicationState) -> None:
         """Detect when the app becomes inactive (likely app switching) and warn."""
         if state == Qt.ApplicationInactive:
-            self._record_violation("Application switched or unfocused")
-            # Try to bring our window back to the foreground
-            QTimer.singleShot(0, self._enforce_foreground)
+            # Judge once focus settles: focus briefly passing to one of our own
+            # dialogs (e.g. the Saved message box) is not a violation
+            QTimer.singleShot(250, self._check_focus_lost)
+
+    def _check_focus_lost(self) -> None:
+        if QGuiApplication.applicationState() == Qt.ApplicationActive or QGuiApplication.focusWindow() is not None:
+            return
+        self._record_violation("Application switched or unfocused")
+        # Try to bring our window back to the foreground
+        self._enforce_foreground()
 
     def _enforce_foreground(self) -> None:
         """Re-assert full-screen and top-most, and reclaim keyboard focus."""
+        # Each step is skipped when already in effect, to avoid needless window-manager requests
         try:
             self.raise_()
-            self.activateWindow()
-            # Re-assert full screen in case it was minimized
-            self.showFullScreen()
-            self.grabKeyboard()
+            if not self.isActiveWindow():
+                self.activateWindow()
+            # Re-assert full screen in case it was minimized or restored
+            if not (self.windowState() & Qt.WindowFullScreen) or self.windowState() & Qt.WindowMinimized:
+                self.showFullScreen()
         except Exception:
             pass
 
-    def keyPressEvent(self, event: QKeyEvent) -> None:  # type: ignore[override]
-        """Intercept special keys/combos and treat as violations, otherwise forward to focused widget."""
-        if self._handle_forbidden_key(event):
-            event.accept()
-            return
-
-        # When keyboard is grabbed by the window, forward non-forbidden keys to the focused widget
-        fw = self.focusWidget()
-        if fw is not None and fw is not self:
-            try:
-                clone = QKeyEvent(event.type(), event.key(), event.modifiers(), event.text(), event.isAutoRepeat(), event.count())
-            except Exception:
-                clone = QKeyEvent(event.type(), event.key(), event.modifiers(), event.text())
-            QCoreApplication.sendEvent(fw, clone)
-            event.accept()
-            return
-
-        super().keyPressEvent(event)
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # type: ignore[override]
+        """Swallow forbidden keys/combos aimed at this window and treat them as violations."""
+        if (
+            event.type() == QEvent.KeyPress
+            and isinstance(obj, QWidget)
+            and obj.window() is self
+            and self._handle_forbidden_key(event)
+        ):
+            return True
+        return super().eventFilter(obj, event)
 
     def _handle_forbidden_key(self, event: QKeyEvent) -> bool:
         key = event.key()
-        mods = event.modifiers()
-
-        # Common OS/system switching or exit shortcuts
-        # Alt+Tab (app switch) - often not delivered to app, but handle when it is
-        if key == Qt.Key_Tab and (mods & Qt.AltModifier):
-            self._record_violation("Alt+Tab detected")
-            return True
-
-        # Alt+F4 (close window)
-        if key == Qt.Key_F4 and (mods & Qt.AltModifier):
-            self._record_violation("Alt+F4 detected")
-            return True
-
-        # Windows/Meta key
-        if key in (Qt.Key_Meta, Qt.Key_Super_L, Qt.Key_Super_R):
-            self._record_violation("Windows key detected")
-            return True
-
-        # Ctrl+Esc (Start menu)
-        if key == Qt.Key_Escape and (mods & Qt.ControlModifier):
-            self._record_violation("Ctrl+Esc detected")
-            return True
-
-        # Ctrl+Shift+Esc (Task Manager)
-        if key == Qt.Key_Escape and (mods & Qt.ControlModifier) and (mods & Qt.ShiftModifier):
-            self._record_violation("Ctrl+Shift+Esc detected")
-            return True
-
-        # Alt key alone pressed (potential attempt)
-        if key == Qt.Key_Alt:
-            self._record_violation("Alt key detected")
-            return True
-
-        return False
+        reason = self._FORBIDDEN_SOLO_KEYS.get(key)
+        if reason is None:
+            mods = event.modifiers()
+            for required, combo_reason in self._FORBIDDEN_COMBOS.get(key, ()):
+                if (mods & required) == required:
+                    reason = combo_reason
+                    break
+        if reason is None:
+            return False
+        self._record_violation(reason)
+        return True
 
     def _record_violation(self, reason: str) -> None:
         """Increment violation count (with minor throttle) and update UI; end if limit reached."""
@@ -289,9 +400,11 @@ class TestWindow(QMainWindow):
         if self.warning_label is not None:
             self.warning_label.setText(f"Warning {self.violation_count}/{self.violation_limit}: {reason}")
             self.warning_label.setVisible(True)
-            # Auto-hide after a short delay if not disqualified
+            # Auto-hide after a short delay if not disqualified; a new violation restarts the delay
             if self.violation_count < self.violation_limit:
-                QTimer.singleShot(3000, lambda: self.warning_label and self.warning_label.setVisible(False))
+                self._warning_hide_timer.start()
+            else:
+                self._warning_hide_timer.stop()
 
         # End test after limit reached
         if self.violation_count >= self.violation_limit:
@@ -306,13 +419,20 @@ class TestWindow(QMainWindow):
 
         if self.remaining_seconds <= 0:
             return
+        self._deadline = time.monotonic() + self.remaining_seconds
         self._countdown_timer = QTimer(self)
+        # Coarse timers may fire up to 5% late; the countdown needs whole-second accuracy
+        self._countdown_timer.setTimerType(Qt.PreciseTimer)
         self._countdown_timer.timeout.connect(self._tick_countdown)
         self._countdown_timer.start(1000)
 
     def _tick_countdown(self) -> None:
         if self.remaining_seconds > 0:
-            self.remaining_seconds -= 1
+            # Recomputed from the deadline so late or missed ticks never accumulate drift
+            remaining = max(0, round(self._deadline - time.monotonic()))
+            if remaining == self.remaining_seconds:
+                return
+            self.remaining_seconds = remaining
             self._update_timer_label()
             if self.remaining_seconds == 0 and self._countdown_timer is not None:
                 self._countdown_timer.stop()
@@ -324,36 +444,48 @@ class TestWindow(QMainWindow):
         if self._ending:
             return
         self._ending = True
-        try:
-            # Perform a final save (blocking post)
-            self.save_answer()
-        finally:
-            # Close the app regardless of save outcome
-            QGuiApplication.quit()
+        self._autosave_timer.stop()
+        # Freeze the answers here: nothing changed after time-up or a violation is submitted
+        self._flush_open_answer()
+        self.centralWidget().setEnabled(False)
+        self._final_payload = self._build_answer_payload()
+        # Final save; the app quits once it completes (see _on_save_finished).
+        # If a save is already in flight, the final one follows when it lands.
+        if self._save_task is None:
+            self._send_final_save()
+
+    def _send_final_save(self) -> None:
+        self._final_save_sent = True
+        self._start_save(notify=True, payload=self._final_payload)
 
     def _update_timer_label(self) -> None:
         if self.timer_label is None:
             return
-        self.timer_label.setText(self._format_seconds(self.remaining_seconds))
-        # Change color based on remaining time
-        color = "#2e7d32"  # green
+        text = self._format_seconds(self.remaining_seconds)
+        if text != self._timer_text:
+            self._timer_text = text
+            self.timer_label.setText(text)
+        # Colour comes from the app stylesheet via the "urgency" property; it only
+        # changes at the 5 minute and 1 minute marks, so the label is rarely repolished
+        urgency = "ok"
         if self.remaining_seconds <= 60:
-            color = "#d32f2f"  # red
+            urgency = "critical"
         elif self.remaining_seconds <= 5 * 60:
-            color = "#f57c00"  # orange
-        self.timer_label.setStyleSheet(
-            f"font-size: 18px; font-weight: bold; padding: 10px; color: {color};"
-        )
+            urgency = "warning"
+        if urgency != self._timer_urgency:
+            self._timer_urgency = urgency
+            self.timer_label.setProperty("urgency", urgency)
+            self.timer_label.style().polish(self.timer_label)
 
     @staticmethod
-    def _format_seconds(total_seconds: int) -> str:
-        if total_seconds < 0:
-            total_seconds = 0
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    def _format_hms(total_seconds: int) -> str:
+        minutes, seconds = divmod(max(0, total_seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+    @staticmethod
+    def _format_ms(total_seconds: int) -> str:
+        minutes, seconds = divmod(max(0, total_seconds), 60)
         return f"{minutes:02d}:{seconds:02d}"
 
     def _populate_sections(self) -> None:
@@ -373,150 +505,218 @@ class TestWindow(QMainWindow):
             self.section_buttons.append(btn)
 
     def _populate_question_bar(self) -> None:
-        """Create/refresh question number buttons for the selected section."""
-        assert self.question_bar_layout is not None
-
-        self._clear_layout(self.question_bar_layout)
-        self.question_buttons.clear()
-
-        if not self.sections:
-            return
+        """Point the question number bar at the selected section."""
+        assert self.question_bar is not None
 
-        section_questions = self.sections[self.selected_section].get("questions", [])
-        for idx, _ in enumerate(section_questions):
-            btn = QPushButton(str(idx + 1))
-            btn.setCheckable(True)
-            btn.setChecked(idx == self.selected_question)
-            btn.clicked.connect(lambda checked, i=idx: self.select_question(i))
-            self.question_bar_layout.addWidget(btn)
-            self.question_buttons.append(btn)
+        count = len(self._questions_by_section[self.selected_section]) if self.sections else 0
+        self.question_model.set_count(count)
+        self._sync_question_bar()
 
     # ---------------------------- ACTIONS ----------------------------
     def select_section(self, section_idx: int) -> None:
         """Switch to the given section and reset question index to 0."""
+        # Only the previously and newly selected buttons change state
+        self._set_section_checked(self.selected_section, False)
+        self._set_section_checked(section_idx, True)
         self.selected_section = section_idx
-        for idx, btn in enumerate(self.section_buttons):
-            btn.setChecked(idx == section_idx)
         self.selected_question = 0
         self._populate_question_bar()
         self._update_question_display()
 
+    def _set_section_checked(self, section_idx: int, checked: bool) -> None:
+        if 0 <= section_idx < len(self.section_buttons):
+            btn = self.section_buttons[section_idx]
+            # Programmatic state changes must not be mistaken for user clicks
+            with QSignalBlocker(btn):
+                btn.setChecked(checked)
+
     def select_question(self, question_idx: int) -> None:
         """Switch to the given question within the current section."""
         self.selected_question = question_idx
-        self._populate_question_bar()  # refresh highlighting
+        self._sync_question_bar()
         self._update_question_display()
 
+    def _sync_question_bar(self) -> None:
+        # Move the bar's current row to the selected question (no-op if already there)
+        assert self.question_bar is not None
+        index = self.question_model.index(self.selected_question, 0)
+        if index.isValid() and self.question_bar.currentIndex() != index:
+            self.question_bar.setCurrentIndex(index)
+            self.question_bar.scrollTo(index)
+
+    def _on_question_bar_changed(self, current: QModelIndex, _previous: QModelIndex) -> None:
+        if current.isValid() and current.row() != self.selected_question:
+            self.select_question(current.row())
+
     def go_to_next_question(self) -> None:
         if not self.sections:
             return
-        questions = self.sections[self.selected_section].get("questions", [])
-        if self.selected_question < len(questions) - 1:
-            self.selected_question += 1
-            self._populate_question_bar()
-            self._update_question_display()
+        if self.selected_question < len(self._questions_by_section[self.selected_section]) - 1:
+            self.select_question(self.selected_question + 1)
         else:
             QMessageBox.information(self, "End of Section", "You have reached the last question in this section.")
 
     def save_answer(self) -> None:
-        """Build the answer JSON and POST it to update-attempt endpoint."""
-        payload = self._build_answer_payload()
+        """Build the answer JSON and POST it to update-attempt endpoint in the background."""
+        self._start_save(notify=True)
 
-        try:
-            self.setDisabled(True)
-            resp = requests.post(Endpoints.UPDATE_ATTEMPT, json=payload, timeout=15)
-            if resp.ok:
+    def _maybe_autosave(self) -> None:
+        """Quietly save if answers changed since the last save and none is in flight."""
+        if self._ending or self._save_task is not None:
+            return
+        self._flush_open_answer()
+        if self._dirty:
+            self._start_save(notify=False)
+
+    def _start_save(self, notify: bool, payload: Optional[Dict[str, Any]] = None) -> None:
+        if self._save_task is not None:
+            if notify:
+                # Run the explicit save, with its message, once the quiet one lands
+                self._save_requested = True
+            return
+        self._flush_open_answer()
+        if self._has_saved and not self._dirty:
+            # Nothing changed since the last successful save; skip the round-trip
+            if notify:
                 QMessageBox.information(self, "Saved", "Your answer(s) have been saved.")
-            else:
-                try:
-                    data = resp.json()
-                    msg = data.get("message") or data.get("detail") or resp.text
-                except Exception:
-                    msg = resp.text
-                QMessageBox.warning(self, "Save Failed", f"Server returned {resp.status_code}: {msg}")
-        except requests.RequestException as ex:
-            QMessageBox.critical(self, "Network Error", f"Failed to save answers: {ex}")
-        finally:
-            self.setDisabled(False)
-
-    # --------------------------- RENDERING ---------------------------
-    def _update_question_display(self) -> None:
-        assert self.question_layout is not None
-        self._clear_layout(self.question_layout)
-
-        if not self.sections:
-            self.question_layout.addWidget(QLabel("No sections available."))
+            if self._ending:
+                QGuiApplication.quit()
             return
-
-        section = self.sections[self.selected_section]
-        questions = section.get("questions", [])
-        if not questions:
-            self.question_layout.addWidget(QLabel("No questions in this section."))
+        if payload is None:
+            payload = self._build_answer_payload()
+        self._dirty = False
+        self._save_notify = notify
+        # Only explicit saves lock the button; autosaves stay invisible
+        if notify:
+            self._set_save_enabled(False)
+        self._save_task = post_async(Endpoints.UPDATE_ATTEMPT, payload, 15, self._on_save_finished)
+
+    def _on_save_finished(self, resp: Any, data: Any, error: Optional[Exception]) -> None:
+        self._save_task = None
+        if self._save_notify:
+            self._set_save_enabled(True)
+        if resp is None or not resp.ok:
+            # Keep the answers marked unsaved so the next autosave retries
+            self._dirty = True
+        else:
+            self._has_saved = True
+        if self._ending and not self._final_save_sent:
+            # An earlier save landed after End Test; send the final one now
+            self._send_final_save()
+            return
+        if self._save_requested and not self._ending:
+            self._save_requested = False
+            self.save_answer()
             return
 
-        q = questions[self.selected_question]
-
-        # Question text
-        q_label = QLabel(q.get("questionText", ""))
-        q_label.setStyleSheet("font-size: 24px; padding: 8px;")
-        q_label.setAlignment(Qt.AlignTop)
-        self.question_layout.addWidget(q_label)
-
-        q_type = q.get("type")
-        options = q.get("options", [])
-
-        if q_type == "mcq":
-            # Single choice: radio buttons
-            group = QButtonGroup(self)
-            selected_idx = self._get_mcq_answer(self.selected_section, self.selected_question)
-            for idx, opt in enumerate(options):
-                radio = QRadioButton(str(opt))
-                radio.setStyleSheet("font-size: 18px; padding: 4px;")
-                radio.setChecked(selected_idx == (idx + 1))
-                radio.toggled.connect(
-                    lambda checked, i=idx: self._on_mcq_toggled(self.selected_section, self.selected_question, i + 1, checked)
-                )
-                self.question_layout.addWidget(radio)
-                group.addButton(radio)
-        elif q_type == "msq":
-            # Multiple choice: checkboxes
-            selected_set = self._get_msq_answer(self.selected_section, self.selected_question)
-            for idx, opt in enumerate(options):
-                cb = QCheckBox(str(opt))
-                cb.setStyleSheet("font-size: 18px; padding: 4px;")
-                cb.setChecked((idx + 1) in selected_set)
-                cb.stateChanged.connect(
-                    lambda state, i=idx: self._on_msq_changed(self.selected_section, self.selected_question, i + 1, state == Qt.Checked)
-                )
-                self.question_layout.addWidget(cb)
-        elif q_type == "open-ended":
-            # Free text
-            existing = self._get_open_answer(self.selected_section, self.selected_question)
-            line_edit = QLineEdit()
-            line_edit.setPlaceholderText("Type your answer here...")
-            if existing is not None:
-                line_edit.setText(existing)
-            line_edit.textChanged.connect(
-                lambda text: self._set_open_answer(self.selected_section, self.selected_question, text)
-            )
-            self.question_layout.addWidget(line_edit)
+        if self._save_notify:
+            self._report_save_result(resp, data, error)
+
+        if self._ending:
+            # Close the app regardless of save outcome
+            QGuiApplication.quit()
+
+    def _report_save_result(self, resp: Any, data: Any, error: Optional[Exception]) -> None:
+        if resp is None:
+            QMessageBox.critical(self, "Network Error", f"Failed to save answers: {error}")
+        elif resp.ok:
+            QMessageBox.information(self, "Saved", "Your answer(s) have been saved.")
         else:
-            self.question_layout.addWidget(QLabel("Unknown question type."))
+            try:
+                msg = data.get("message") or data.get("detail") or resp.text
+            except Exception:
+                msg = resp.text
+            QMessageBox.warning(self, "Save Failed", f"Server returned {resp.status_code}: {msg}")
 
-        # Actions
-        buttons_row = QWidget()
-        row_layout = QHBoxLayout()
-        row_layout.setAlignment(Qt.AlignCenter)
+    def _set_save_enabled(self, enabled: bool) -> None:
+        if self._save_button is not None:
+            self._save_button.setEnabled(enabled)
 
-        save_button = QPushButton("Save")
-        next_button = QPushButton("Next")
-        save_button.clicked.connect(self.save_answer)
-        next_button.clicked.connect(self.go_to_next_question)
+    # --------------------------- RENDERING ---------------------------
+    def _update_question_display(self) -> None:
+        # Suspend painting while options are swapped so the area repaints once
+        self.question_area.setUpdatesEnabled(False)
+        try:
+            self._render_question()
+        finally:
+            self.question_area.setUpdatesEnabled(True)
 
-        row_layout.addWidget(save_button)
-        row_layout.addWidget(next_button)
-        buttons_row.setLayout(row_layout)
-        self.question_layout.addWidget(buttons_row)
+    def _render_question(self) -> None:
+        assert self._options_layout is not None
+        self._flush_open_answer()
+
+        q: Optional[Dict[str, Any]] = None
+        if not self.sections:
+            self._show_placeholder("No sections available.")
+        else:
+            questions = self._questions_by_section[self.selected_section]
+            if not questions:
+                self._show_placeholder("No questions in this section.")
+            else:
+                q = questions[self.selected_question]
+
+        q_type = q.get("type") if q is not None else None
+        options = q.get("options", []) if q is not None else []
+        key = (self.selected_section, self.selected_question)
+
+        if q is not None:
+            # Question text
+            self._q_label.setText(q.get("questionText", ""))
+            self._buttons_row.setVisible(True)
+
+        # Single choice: radio buttons
+        selected_idx = self._get_mcq_answer(*key) if q_type == "mcq" else None
+        self._fill_choices(self._radio_pool, QRadioButton, self._mcq_group,
+                           options if q_type == "mcq" else [], {selected_idx})
+        # Multiple choice: checkboxes
+        selected_set = self._get_msq_answer(*key) if q_type == "msq" else set()
+        self._fill_choices(self._checkbox_pool, QCheckBox, self._msq_group,
+                           options if q_type == "msq" else [], selected_set)
+
+        # Free text
+        if q_type == "open-ended":
+            with QSignalBlocker(self._open_edit):
+                self._open_edit.setText(self._get_open_answer(*key) or "")
+            self._open_key = key
+        else:
+            self._open_key = None
+        self._open_edit.setVisible(q_type == "open-ended")
+
+        self._unknown_label.setVisible(q is not None and q_type not in ("mcq", "msq", "open-ended"))
+
+    def _fill_choices(
+        self,
+        pool: List[Union[QRadioButton, QCheckBox]],
+        button_type: type,
+        group: QButtonGroup,
+        options: List[Any],
+        checked_ids: Set[Optional[int]],
+    ) -> None:
+        """Show one pooled button per option, growing the pool on demand, and hide the rest."""
+        while len(pool) < len(options):
+            button = button_type()
+            button.hide()
+            self._options_layout.addWidget(button)
+            group.addButton(button, len(pool) + 1)
+            pool.append(button)
+
+        # Restoring the stored state must not read as an answer; exclusivity is
+        # lifted so a previously checked radio can be cleared
+        exclusive = group.exclusive()
+        with QSignalBlocker(group):
+            group.setExclusive(False)
+            for idx, button in enumerate(pool):
+                shown = idx < len(options)
+                if shown:
+                    button.setText(str(options[idx]))
+                button.setChecked(shown and (idx + 1) in checked_ids)
+                button.setVisible(shown)
+            group.setExclusive(exclusive)
+
+    def _show_placeholder(self, text: str) -> None:
+        """Show a message in place of a question (no options, no actions)."""
+        self._q_label.setText(text)
+        self._buttons_row.setVisible(False)
 
     # ---------------------------- HELPERS ----------------------------
     @staticmethod
@@ -525,80 +725,86 @@ class TestWindow(QMainWindow):
             item = layout.takeAt(0)
             w = item.widget()
             if w is not None:
-                w.setParent(None)
+                # Hidden now, destroyed by Qt once control returns to the event loop
+                w.hide()
+                w.deleteLater()
 
     # ---------------------------- ANSWERS ----------------------------
+    def _on_mcq_id_toggled(self, option_1based: int, checked: bool) -> None:
+        self._on_mcq_toggled(self.selected_section, self.selected_question, option_1based, checked)
+
     def _on_mcq_toggled(self, section_idx: int, question_idx: int, option_1based: int, checked: bool) -> None:
         if checked:
-            self.answers.setdefault(section_idx, {})[question_idx] = option_1based
+            self._mcq_answers[(section_idx, question_idx)] = option_1based
+            self._set_entry(section_idx, question_idx, {"questionNumber": question_idx + 1, "CorrectOption": option_1based})
+
+    def _on_msq_id_toggled(self, option_1based: int, checked: bool) -> None:
+        self._on_msq_changed(self.selected_section, self.selected_question, option_1based, checked)
 
     def _on_msq_changed(self, section_idx: int, question_idx: int, option_1based: int, checked: bool) -> None:
-        section_map: Dict[int, Any] = self.answers.setdefault(section_idx, {})
-        current: Set[int] = section_map.get(question_idx)
-        if not isinstance(current, set):
-            current = set()
-        if checked:
-            current.add(option_1based)
+        current = self._msq_answers.setdefault((section_idx, question_idx), [])
+        # Kept sorted as options change so saving never has to sort
+        pos = bisect_left(current, option_1based)
+        present = pos < len(current) and current[pos] == option_1based
+        if checked and not present:
+            insort(current, option_1based)
+        elif not checked and present:
+            del current[pos]
         else:
-            current.discard(option_1based)
-        section_map[question_idx] = current
+            return
+        self._set_entry(
+            section_idx, question_idx,
+            {"questionNumber": question_idx + 1, "CorrectOptions": list(current)} if current else None,
+        )
 
     def _set_open_answer(self, section_idx: int, question_idx: int, text: str) -> None:
-        self.answers.setdefault(section_idx, {})[question_idx] = text
+        self._open_answers[(section_idx, question_idx)] = text
+        self._set_entry(
+            section_idx, question_idx,
+            {"questionNumber": question_idx + 1, "answer": text} if text.strip() else None,
+        )
+
+    def _set_entry(self, section_idx: int, question_idx: int, entry: Optional[Dict[str, Any]]) -> None:
+        """Replace (or drop, if None) the wire-format entry for a question and mark answers unsaved."""
+        if entry is not None:
+            self._answer_entries.setdefault(section_idx, {})[question_idx] = entry
+        else:
+            self._answer_entries.get(section_idx, {}).pop(question_idx, None)
+        self._dirty = True
+
+    def _on_open_text_changed(self, _text: str) -> None:
+        # (Re)start the debounce; the text is read from the field when it fires
+        self._open_timer.start()
+
+    def _store_open_answer(self) -> None:
+        if self._open_key is not None:
+            self._set_open_answer(*self._open_key, self._open_edit.text())
+
+    def _flush_open_answer(self) -> None:
+        """Store the visible open-ended answer now if a debounced edit is pending."""
+        if self._open_timer.isActive():
+            self._open_timer.stop()
+            self._store_open_answer()
 
     def _get_mcq_answer(self, section_idx: int, question_idx: int) -> Optional[int]:
-        val = self.answers.get(section_idx, {}).get(question_idx)
-        return int(val) if isinstance(val, int) else None
+        return self._mcq_answers.get((section_idx, question_idx))
 
     def _get_msq_answer(self, section_idx: int, question_idx: int) -> Set[int]:
-        val = self.answers.get(section_idx, {}).get(question_idx)
-        return set(val) if isinstance(val, set) else set()
+        return set(self._msq_answers.get((section_idx, question_idx), ()))
 
     def _get_open_answer(self, section_idx: int, question_idx: int) -> Optional[str]:
-        val = self.answers.get(section_idx, {}).get(question_idx)
-        return str(val) if isinstance(val, str) else None
+        return self._open_answers.get((section_idx, question_idx))
 
     def _build_answer_payload(self) -> Dict[str, Any]:
         """Build payload matching sample answer_request.json format."""
-        sections_payload: List[Dict[str, Any]] = []
-
-        for s_idx, section in enumerate(self.sections):
-            questions = section.get("questions", [])
-            answers_list: List[Dict[str, Any]] = []
-            section_answers = self.answers.get(s_idx, {})
-
-            for q_idx, q in enumerate(questions):
-                q_type = q.get("type")
-                stored = section_answers.get(q_idx)
-                if stored is None:
-                    continue
-
-                q_number = q_idx + 1  # 1-based
-                if q_type == "mcq" and isinstance(stored, int):
-                    answers_list.append({
-                        "questionNumber": q_number,
-                        "CorrectOption": stored,
-                    })
-                elif q_type == "msq" and isinstance(stored, set) and stored:
-                    answers_list.append({
-                        "questionNumber": q_number,
-                        "CorrectOptions": sorted(list(stored)),
-                    })
-                elif q_type == "open-ended" and isinstance(stored, str) and stored.strip() != "":
-                    answers_list.append({
-                        "questionNumber": q_number,
-                        "answer": stored,
-                    })
-
-            if answers_list:
-                sections_payload.append({
-                    "sectionId": s_idx + 1,  # 1-based
-                    "answers": answers_list,
-                })
-
-        return {
-            "email": self.email,
-            "token": self.token,
-            "attempt_id": self.attempt_id,
-            "answer": {"sections": sections_payload},
-        }
\ No newline at end of file
+        # Entries are prebuilt as answers change; only sections/questions need ordering
+        sections_payload: List[Dict[str, Any]] = [
+            {
+                "sectionId": s_idx + 1,  # 1-based
+                "answers": [entries[q_idx] for q_idx in sorted(entries)],
+            }
+            for s_idx, entries in sorted(self._answer_entries.items())
+            if entries
+        ]
+
+        return {**self._payload_prefix, "answer": {"sections": sections_payload}}